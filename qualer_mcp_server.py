@@ -7,10 +7,22 @@ Exposes Qualer API operations as MCP tools and read-only data as resources.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import importlib.util
+import logging
 import os
-from typing import Optional
-
+import re
+import secrets
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Annotated, Any, TypeVar
+
+import httpx
+import ijson
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
@@ -20,52 +32,332 @@ from qualer_sdk.api.assets import get_asset as sdk_get_asset
 from qualer_sdk.api.assets import get_asset_manager_list
 from qualer_sdk.api.service_order_documents import get_documents_list
 from qualer_sdk.api.service_orders import get_work_order, get_work_orders
+from qualer_sdk.errors import UnexpectedStatus
+from qualer_sdk.types import UNSET
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+__all__ = [
+    "Config",
+    "NotFoundError",
+    "asset_resource",
+    "clear_caches",
+    "get_asset",
+    "get_assets_batch",
+    "get_client",
+    "get_service_order",
+    "get_service_orders_batch",
+    "init_client",
+    "list_service_order_documents",
+    "list_service_order_documents_batch",
+    "main",
+    "mcp",
+    "search_assets",
+    "search_service_orders",
+    "service_order_resource",
+    "set_client",
+]
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Logs go to stderr; stdout carries the stdio transport
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # Configuration & Client
 # ============================================================================
 
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Server settings, read from the environment once at import."""
+
+    base_url: str
+    token: str | None
+    so_cache_ttl: float
+    asset_cache_ttl: float
+    not_found_cache_ttl: float
+    stale_cache_ttl: float
+    max_inflight: int
+
+    @classmethod
+    def from_env(cls) -> Config:
+        return cls(
+            base_url=os.getenv("QUALER_BASE_URL", "https://jgiquality.qualer.com"),
+            token=os.getenv("QUALER_TOKEN"),
+            so_cache_ttl=float(os.getenv("QUALER_SO_CACHE_TTL", "10")),
+            asset_cache_ttl=float(os.getenv("QUALER_ASSET_CACHE_TTL", "60")),
+            not_found_cache_ttl=float(os.getenv("QUALER_NOT_FOUND_CACHE_TTL", "5")),
+            stale_cache_ttl=float(os.getenv("QUALER_STALE_CACHE_TTL", "300")),
+            max_inflight=int(os.getenv("QUALER_MAX_INFLIGHT", "20")),
+        )
+
+
+_CONFIG = Config.from_env()
+
 # Global SDK client
-_client: Optional[AuthenticatedClient] = None
+_client: AuthenticatedClient | None = None
+_client_lock = threading.Lock()
+
+# Connection tuning for the shared httpx client. A single agent turn often
+# issues several small GETs back to back; keeping connections alive (and
+# multiplexing them over HTTP/2 where Qualer negotiates it via ALPN) avoids
+# paying a TCP+TLS handshake per tool call. Response compression needs no
+# setup: httpx advertises gzip, and brotli once the extra is installed.
+_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+# httpx refuses http2=True without the h2 package; fall back to HTTP/1.1
+# keep-alive rather than failing to start.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=_CONFIG.max_inflight,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# Caps in-flight Qualer requests at the pool size, so a large gather waits
+# here cooperatively instead of piling up in httpx's pool queue (where
+# waiting eats into each request's timeout).
+_request_slots = asyncio.Semaphore(_CONFIG.max_inflight)
 
 
 def get_client() -> AuthenticatedClient:
-    """Get the initialized Qualer SDK client."""
-    if _client is None:
-        raise RuntimeError("Qualer SDK client not initialized")
-    return _client
+    """Get the Qualer SDK client, initializing it on first use."""
+    global _client
+
+    # Fast path: once set, the client is read without taking the lock
+    client = _client
+    if client is not None:
+        return client
+
+    with _client_lock:
+        if _client is None:
+            _client = init_client()
+        return _client
 
 
 def set_client(client: AuthenticatedClient) -> None:
     """Set the Qualer SDK client (used for testing)."""
     global _client
     _client = client
+    clear_caches()
+
+
+# Failures talking to Qualer or decoding its responses. Tools wrap these in
+# ValueError with context; anything else (our own ValueErrors included)
+# propagates unchanged. A body that is not JSON is Qualer's failure, so
+# both parsers' decode errors count.
+_UPSTREAM_ERRORS = (
+    httpx.HTTPError,
+    UnexpectedStatus,
+    ijson.JSONError,
+    orjson.JSONDecodeError,
+)
+
+
+async def _send(request: dict[str, Any]) -> httpx.Response:
+    """
+    Send a request built by a qualer_sdk endpoint's ``_get_kwargs``.
+
+    The body is left unparsed, so callers that only need plain JSON can skip
+    the SDK's model parsing and ``to_dict()`` round trip.
+    """
+    async with _request_slots:
+        return await get_client().get_async_httpx_client().request(**request)
 
 
 def init_client() -> AuthenticatedClient:
     """Initialize the Qualer SDK client with credentials from environment."""
-    base_url = os.getenv("QUALER_BASE_URL", "https://jgiquality.qualer.com")
-    token = os.getenv("QUALER_TOKEN")
-
-    if not token:
+    if not _CONFIG.token:
         raise ValueError("QUALER_TOKEN environment variable is required")
 
-    return AuthenticatedClient(
-        base_url=base_url,
-        token=token,
+    client = AuthenticatedClient(
+        base_url=_CONFIG.base_url,
+        token=_CONFIG.token,
+        timeout=_HTTP_TIMEOUT,
         raise_on_unexpected_status=True,
+        headers={"Accept": "application/json"},
+    )
+
+    # The async httpx client is built here rather than through httpx_args,
+    # which the SDK also hands to its sync client, where an async transport
+    # would fail. One transport, and so one connection pool, for the life of
+    # the client. It also retries a failed connect once before giving up.
+    auth = f"{client.prefix} {client.token}" if client.prefix else client.token
+    return client.set_async_httpx_client(
+        httpx.AsyncClient(
+            base_url=_CONFIG.base_url,
+            headers={"Accept": "application/json", client.auth_header_name: auth},
+            timeout=_HTTP_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(
+                http2=_HTTP2_AVAILABLE,
+                limits=_HTTP_LIMITS,
+                retries=1,
+            ),
+        )
     )
 
 
+# ============================================================================
+# Response Cache
+# ============================================================================
+
+# Agents tend to re-read the same service order or asset several times in
+# one reasoning loop; a short-lived cache turns those repeats into local hits
+# instead of Qualer round trips. Service orders (and their documents) change
+# often, so they expire sooner than assets. Keys are (kind, id) tuples.
+# Service orders and assets are cached as the raw JSON body, so resources
+# can serve it verbatim and each tool call decodes its own copy.
+_so_cache: TTLCache = TTLCache(maxsize=1024, ttl=_CONFIG.so_cache_ttl)
+_asset_cache: TTLCache = TTLCache(maxsize=1024, ttl=_CONFIG.asset_cache_ttl)
+_documents_cache: TTLCache = TTLCache(maxsize=1024, ttl=_CONFIG.so_cache_ttl)
+
+# Recent 404s, so an agent retrying a bad ID does not hit Qualer each time
+_not_found_cache: TTLCache = TTLCache(maxsize=1024, ttl=_CONFIG.not_found_cache_ttl)
+
+# Last good copy of every cached lookup, kept past its fresh TTL so reads
+# can still be answered while Qualer is down. Keys are shared with the
+# caches above, which already keep kinds apart.
+_stale_cache: TTLCache = TTLCache(maxsize=3072, ttl=_CONFIG.stale_cache_ttl)
+
+# Full search_service_orders results, keyed by the opaque cursor handed out
+# for the next page. Paging through a result set fetches it only once.
+_CURSOR_TTL_SECONDS = 60
+
+_cursor_cache: TTLCache = TTLCache(maxsize=1024, ttl=_CURSOR_TTL_SECONDS)
+
+# Lookups currently in flight, keyed like the caches. The cache absorbs
+# repeated lookups; this absorbs concurrent ones.
+_inflight: dict[tuple[str, int], asyncio.Future] = {}
+
+# The caches are only touched from the event loop thread and never across an
+# await, so they need no locking.
+
+T = TypeVar("T")
+
+
+class NotFoundError(ValueError):
+    """Raised when Qualer has no record with the requested ID."""
+
+
+async def _cached(
+    cache: TTLCache,
+    key: tuple[str, int],
+    fetch: Callable[[], Awaitable[T]],
+) -> T:
+    """Return the cached value for ``key``, awaiting ``fetch`` on a miss."""
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    message = _not_found_cache.get(key)
+    if message is not None:
+        raise NotFoundError(message)
+
+    # Concurrent misses for the same key share one fetch. The shield keeps a
+    # cancelled caller from cancelling the fetch other callers are awaiting.
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fill(cache, key, fetch))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
+async def _fill(
+    cache: TTLCache,
+    key: tuple[str, int],
+    fetch: Callable[[], Awaitable[T]],
+) -> T:
+    """Await ``fetch`` and store its result (or a 404) under ``key``."""
+    try:
+        value = await fetch()
+    except NotFoundError as e:
+        _not_found_cache[key] = str(e)
+        raise
+
+    cache[key] = value
+    _stale_cache[key] = value
+    return value
+
+
+def _is_outage(error: BaseException | None) -> bool:
+    """Whether ``error`` means Qualer is unreachable or failing, not refusing."""
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    if isinstance(error, UnexpectedStatus):
+        return error.status_code >= 500
+    return False
+
+
+async def _with_stale_fallback(key: tuple[str, int], lookup: Awaitable[T]) -> tuple[T, bool]:
+    """
+    Await ``lookup``, falling back to the last good value for ``key`` if
+    Qualer is down.
+
+    Returns the value and whether it is stale. Errors other than an outage
+    (404s, auth failures, bad responses) are raised as usual.
+    """
+    try:
+        return await lookup, False
+    except ValueError as e:
+        value = _stale_cache.get(key)
+        if value is None or not _is_outage(e.__cause__):
+            raise
+        logger.warning("%s; serving stale %s %s", e, *key)
+        return value, True
+
+
+def clear_caches() -> None:
+    """Drop all cached Qualer responses."""
+    _so_cache.clear()
+    _asset_cache.clear()
+    _documents_cache.clear()
+    _not_found_cache.clear()
+    _stale_cache.clear()
+    _cursor_cache.clear()
+
+
 # ============================================================================
 # MCP Server Instance
 # ============================================================================
 
-mcp = FastMCP("Qualer SDK")
+
+# Sessions currently inside _lifespan; they all share the one client
+_open_sessions = 0
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """
+    Close the shared Qualer connection pool when the server shuts down.
+
+    SSE and streamable-HTTP transports enter this once per session, so the
+    pool is closed only when the last open session ends. The client is
+    dropped as well, and get_client() builds a fresh one for the next
+    session.
+    """
+    global _client, _open_sessions
+
+    _open_sessions += 1
+    try:
+        yield
+    finally:
+        _open_sessions -= 1
+        if _open_sessions == 0:
+            with _client_lock:
+                client, _client = _client, None
+            if client is not None:
+                await client.get_async_httpx_client().aclose()
+
+
+mcp = FastMCP("Qualer SDK", lifespan=_lifespan)
 
 
 # ============================================================================
@@ -74,227 +366,412 @@ mcp = FastMCP("Qualer SDK")
 
 
 @mcp.tool()
-def get_service_order(
-    so_id: int = Field(description="Service order ID to retrieve"),
+async def get_service_order(
+    so_id: Annotated[int, Field(description="Service order ID to retrieve")],
 ) -> dict:
     """
     Fetch a single service order by its ID.
 
     Returns full details including status, client info, and timestamps.
     Use this when you need current information about a specific SO.
+    If Qualer is unreachable, a recently fetched copy may be returned with
+    'Cache-Warning' set to 'stale'.
     """
-    client = get_client()
+    body, stale = await _get_service_order_raw(so_id)
+    return _decode(body, stale)
 
+
+async def _get_service_order_raw(so_id: int) -> tuple[bytes, bool]:
+    """Return a service order's JSON body exactly as Qualer sent it, and whether it is stale."""
+    key = ("so", so_id)
+    return await _with_stale_fallback(
+        key, _cached(_so_cache, key, lambda: _fetch_service_order(so_id))
+    )
+
+
+def _decode(body: bytes, stale: bool) -> dict:
+    """Decode a cached JSON record, flagging it if it is stale."""
+    record = orjson.loads(body)
+    if stale:
+        record["Cache-Warning"] = "stale"
+    return record
+
+
+def _resource_text(body: bytes, stale: bool) -> str:
+    """Return a cached JSON record as resource text, flagging it if it is stale."""
+    # Qualer's body is already JSON; pass it through without re-encoding.
+    # Only the rare stale copy is decoded, to carry the warning.
+    if stale:
+        body = orjson.dumps(_decode(body, stale))
+    return body.decode()
+
+
+async def _fetch_service_order(so_id: int) -> bytes:
+    """Fetch a service order's JSON body from Qualer, bypassing the cache."""
     try:
-        response = get_work_order.sync_detailed(
-            service_order_id=so_id,
-            client=client,
-        )
+        response = await _send(get_work_order._get_kwargs(service_order_id=so_id))
 
         if response.status_code == 404:
-            raise ValueError(f"Service order {so_id} not found")
-
-        if response.parsed is None:
-            raise ValueError(f"Failed to parse service order {so_id}")
+            raise NotFoundError(f"Service order {so_id} not found")
+        response.raise_for_status()
 
-        # Convert SDK model to dict
-        return response.parsed.to_dict()
+        # Only cache a body that parses; a 200 login page must not be kept
+        orjson.loads(response.content)
+        return response.content
 
-    except ValueError:
-        # Re-raise ValueError as-is
-        raise
-    except Exception as e:
+    except _UPSTREAM_ERRORS as e:
         raise ValueError(f"Error fetching service order {so_id}: {str(e)}") from e
 
 
+# Rows a new search asks Qualer for; cursor pages walk this window locally.
+# It matches the largest page a caller may request, so a search never costs
+# more than a limit=100 call did before cursors existed.
+_SEARCH_WINDOW = 100
+
+
 @mcp.tool()
-def search_service_orders(
-    status: Optional[str] = Field(
-        default=None, description="Filter by status (e.g., Open, Closed)"
-    ),
-    limit: int = Field(
-        default=25,
-        ge=1,
-        le=100,
-        description="Maximum items to return (1-100)",
-    ),
+async def search_service_orders(
+    status: Annotated[
+        str | None,
+        Field(description="Filter by status (e.g., Open, Closed)"),
+    ] = None,
+    limit: Annotated[
+        int,
+        Field(ge=1, le=100, description="Maximum items to return (1-100)"),
+    ] = 25,
+    cursor: Annotated[
+        str | None,
+        Field(description="'next_cursor' from a previous call, to fetch the next page"),
+    ] = None,
 ) -> dict:
     """
     Search service orders with optional filters and pagination.
 
-    Supports filtering by status. Returns paginated results.
+    Supports filtering by status. Returns dict with 'items' (service
+    order list), 'total' (matching rows fetched, at most 100),
+    'truncated' (whether Qualer may hold more matches than were fetched;
+    narrow the search to reach them) and 'next_cursor' (pass back as
+    cursor to get the next page, None on the last page). When a cursor is
+    given, status is ignored in favour of the original search.
     """
-    client = get_client()
-
+    if cursor:
+        page = _cursor_cache.get(cursor)
+        if page is None:
+            raise ValueError("Cursor expired or invalid; repeat the search without it")
+        orders, offset = page
+    else:
+        orders = await _fetch_service_orders(status)
+        offset = 0
+
+    # Stash the fetched rows behind a cursor so later pages skip the refetch
+    end = offset + limit
+    next_cursor = None
+    if end < len(orders):
+        next_cursor = secrets.token_urlsafe(12)
+        _cursor_cache[next_cursor] = (orders, end)
+
+    return {
+        "items": orders[offset:end],
+        "total": len(orders),
+        "truncated": len(orders) >= _SEARCH_WINDOW,
+        "next_cursor": next_cursor,
+    }
+
+
+async def _fetch_service_orders(status: str | None) -> list:
+    """Fetch up to _SEARCH_WINDOW service orders matching ``status`` from Qualer."""
     try:
-        response = get_work_orders.sync_detailed(
-            client=client,
-            limit=limit,
-            status=status,
-        )
-
-        if response.parsed is None:
-            raise ValueError("Failed to parse service orders")
+        response = await _send(get_work_orders._get_kwargs(status=status, limit=_SEARCH_WINDOW))
+        response.raise_for_status()
 
-        return response.parsed.to_dict()
+        return orjson.loads(response.content)
 
-    except ValueError:
-        # Re-raise ValueError as-is
-        raise
-    except Exception as e:
+    except _UPSTREAM_ERRORS as e:
         raise ValueError(f"Error searching service orders: {str(e)}") from e
 
 
 @mcp.tool()
-def get_asset(
-    asset_id: int = Field(description="Asset ID to retrieve"),
+async def get_asset(
+    asset_id: Annotated[int, Field(description="Asset ID to retrieve")],
 ) -> dict:
     """
     Fetch a single asset/equipment record by its ID.
 
     Returns full details including serial number, model, manufacturer,
-    and location.
+    and location. If Qualer is unreachable, a recently fetched copy may be
+    returned with 'Cache-Warning' set to 'stale'.
     """
-    client = get_client()
+    body, stale = await _get_asset_raw(asset_id)
+    return _decode(body, stale)
+
+
+async def _get_asset_raw(asset_id: int) -> tuple[bytes, bool]:
+    """Return an asset's JSON body exactly as Qualer sent it, and whether it is stale."""
+    key = ("asset", asset_id)
+    return await _with_stale_fallback(
+        key, _cached(_asset_cache, key, lambda: _fetch_asset(asset_id))
+    )
+
 
+async def _fetch_asset(asset_id: int) -> bytes:
+    """Fetch an asset's JSON body from Qualer, bypassing the cache."""
     try:
-        response = sdk_get_asset.sync_detailed(
-            id=asset_id,
-            client=client,
-        )
+        response = await _send(sdk_get_asset._get_kwargs(id=asset_id))
 
         if response.status_code == 404:
-            raise ValueError(f"Asset {asset_id} not found")
-
-        if response.parsed is None:
-            raise ValueError(f"Failed to parse asset {asset_id}")
+            raise NotFoundError(f"Asset {asset_id} not found")
+        response.raise_for_status()
 
-        return response.parsed.to_dict()
+        # As for service orders, only a body that parses may be cached
+        orjson.loads(response.content)
+        return response.content
 
-    except ValueError:
-        # Re-raise ValueError as-is
-        raise
-    except Exception as e:
+    except _UPSTREAM_ERRORS as e:
         raise ValueError(f"Error fetching asset {asset_id}: {str(e)}") from e
 
 
+# Asset attributes matched by search_assets when filtering client-side
+_ASSET_SEARCH_FIELDS = ("name", "serial_number", "model")
+
+
 @mcp.tool()
-def search_assets(
-    query: Optional[str] = Field(
-        default=None,
-        description="Search query (name, serial number, model, etc.)",
-    ),
-    limit: int = Field(
-        default=25,
-        ge=1,
-        le=100,
-        description="Maximum items to return (1-100)",
-    ),
-    server_side: bool = Field(
-        default=True,
-        description="Use server-side filtering (faster for large datasets)",
-    ),
+async def search_assets(
+    query: Annotated[
+        str | None,
+        Field(description="Search query (name, serial number, model, etc.)"),
+    ] = None,
+    limit: Annotated[
+        int,
+        Field(ge=1, le=100, description="Maximum items to return (1-100)"),
+    ] = 25,
+    server_side: Annotated[
+        bool,
+        Field(description="Use server-side filtering (faster for large datasets)"),
+    ] = True,
 ) -> dict:
     """
     Search/list assets with optional filtering.
 
-    When server_side=True (default): Uses server-side search for efficiency.
+    When server_side=True (default): Qualer searches (or, without a query,
+    lists) assets and returns a single page of at most 'limit' rows.
     When server_side=False: Fetches all assets and filters client-side.
 
     Server-side filtering recommended for production systems with many assets.
 
-    Returns dict with 'items' (asset list) and 'total' (matching count before
-    limit). Items are truncated to the limit parameter.
+    Returns dict with 'items' (asset list), 'total' (matching count before
+    limit; for server-side searches, the number of items returned) and
+    'truncated' (whether more matching assets exist beyond the limit).
+    Items are truncated to the limit parameter.
     """
-    client = get_client()
-
     try:
-        # Use server-side filtering if query provided
-        if query and server_side:
-            response = get_asset_manager_list.sync_detailed(
-                client=client,
-                model_search_string=query,
-                model_page_size=limit,
+        # Let Qualer filter and page, so only one page crosses the wire. One
+        # row past the limit tells us whether more assets match.
+        if server_side:
+            response = await _send(
+                get_asset_manager_list._get_kwargs(
+                    model_search_string=query or UNSET,
+                    model_page_size=limit + 1,
+                )
             )
+            response.raise_for_status()
 
-            if response.parsed is None:
-                raise ValueError("Failed to parse assets")
-
-            # Convert SDK models to dicts
-            assets = [asset.to_dict() for asset in response.parsed]
-            total = len(assets)
-            return {"items": assets[:limit], "total": total}
+            assets = orjson.loads(response.content)
+            items = assets[:limit]
+            return {"items": items, "total": len(items), "truncated": len(assets) > limit}
 
-        # Fall back to client-side filtering for all assets
-        response = get_all_assets.sync_detailed(client=client)
+        # Client-side filtering over every asset
+        client = get_client()
+        async with _request_slots:
+            response = await get_all_assets.asyncio_detailed(client=client)
 
         if response.parsed is None:
             raise ValueError("Failed to parse assets")
 
-        # Convert list of SDK models to list of dicts
-        assets = [asset.to_dict() for asset in response.parsed]
+        assets = response.parsed
 
-        # If query provided, filter results client-side
+        # If query provided, filter the SDK models directly so only the
+        # returned page is ever converted to dicts. A case-insensitive regex
+        # avoids allocating a lowercased copy of every field.
         if query:
-            query_lower = query.lower()
-
-            def matches_query(asset: dict) -> bool:
-                name = asset.get("name")
-                serial = asset.get("serial_number")
-                model = asset.get("model")
-                return bool(
-                    (name and query_lower in str(name).lower())
-                    or (serial and query_lower in str(serial).lower())
-                    or (model and query_lower in str(model).lower())
+            matches = re.compile(re.escape(query), re.IGNORECASE).search
+            assets = [
+                asset
+                for asset in assets
+                if any(
+                    value and matches(str(value))
+                    for value in (getattr(asset, field, None) for field in _ASSET_SEARCH_FIELDS)
                 )
-
-            assets = [a for a in assets if matches_query(a)]
+            ]
 
         # Apply limit
         total = len(assets)
-        return {"items": assets[:limit], "total": total}
+        return {
+            "items": [asset.to_dict() for asset in assets[:limit]],
+            "total": total,
+            "truncated": total > limit,
+        }
 
-    except ValueError:
-        # Re-raise ValueError as-is
-        raise
-    except Exception as e:
+    except _UPSTREAM_ERRORS as e:
         raise ValueError(f"Error searching assets: {str(e)}") from e
 
 
 @mcp.tool()
-def list_service_order_documents(
-    so_id: int = Field(description="Service order ID to list documents for"),
+async def list_service_order_documents(
+    so_id: Annotated[int, Field(description="Service order ID to list documents for")],
+    limit: Annotated[
+        int | None,
+        Field(ge=1, description="Maximum documents to return (default: all)"),
+    ] = None,
 ) -> dict:
     """
     List all documents attached to a service order.
 
-    Returns metadata for each document (filename, upload time, size).
+    Returns metadata for each document (filename, upload time, size), and
+    'truncated' (whether more documents exist beyond the limit). If Qualer
+    is unreachable, a recently fetched listing may be returned with
+    'Cache-Warning' set to 'stale'.
+    """
+    key = ("documents", so_id)
+    if limit is None or key in _documents_cache:
+        lookup = _cached(_documents_cache, key, lambda: _fetch_documents(so_id))
+    else:
+        # Read one document past the limit to learn whether more exist
+        lookup = _fetch_documents(so_id, max_items=limit + 1)
+    listing, stale = await _with_stale_fallback(key, lookup)
+
+    docs = listing["documents"]
+    result = {
+        "service_order_id": so_id,
+        "documents": docs[:limit],
+        "truncated": limit is not None and len(docs) > limit,
+    }
+    if stale:
+        result["Cache-Warning"] = "stale"
+    return result
+
+
+async def _fetch_documents(so_id: int, max_items: int | None = None) -> dict:
+    """
+    Fetch a service order's document list from Qualer, bypassing the cache.
+
+    With ``max_items``, stops reading the response once that many documents
+    have been parsed; the rest of the body is never downloaded.
     """
     client = get_client()
 
+    # Reuse the SDK's request description (path, params), but stream the body
+    # through an incremental JSON parser instead of buffering it and building
+    # an SDK model per document.
+    request = get_documents_list._get_kwargs(service_order_id=so_id)
+
     try:
-        response = get_documents_list.sync_detailed(
-            service_order_id=so_id,
-            client=client,
-        )
+        async with (
+            _request_slots,
+            client.get_async_httpx_client().stream(**request) as response,
+        ):
+            if response.status_code == 404:
+                raise NotFoundError(f"Service order {so_id} not found")
+            response.raise_for_status()
+
+            docs = ijson.sendable_list()
+            parser = ijson.items_coro(docs, "item", use_float=True)
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                if max_items is not None and len(docs) >= max_items:
+                    break
+            else:
+                parser.close()
+
+        return {"service_order_id": so_id, "documents": docs[:max_items]}
+
+    except _UPSTREAM_ERRORS as e:
+        msg = f"Error fetching documents for SO {so_id}: {str(e)}"
+        raise ValueError(msg) from e
 
-        if response.status_code == 404:
-            raise ValueError(f"Service order {so_id} not found")
 
-        if response.parsed is None:
-            msg = f"Failed to parse documents for service order {so_id}"
-            raise ValueError(msg)
+# Upper bound on concurrent Qualer requests issued by one batch tool call,
+# so a large batch does not trip Qualer's rate limiting.
+_BATCH_CONCURRENCY = 10
 
-        # Convert list of SDK models to list of dicts
-        docs = [doc.to_dict() for doc in response.parsed]
-        return {"service_order_id": so_id, "documents": docs}
 
-    except ValueError:
-        # Re-raise ValueError as-is
-        raise
-    except Exception as e:
-        msg = f"Error fetching documents for SO {so_id}: {str(e)}"
-        raise ValueError(msg) from e
+async def _fetch_batch(
+    fetch: Callable[[int], Awaitable[dict]],
+    ids: list[int],
+) -> dict:
+    """
+    Run ``fetch`` for each ID concurrently, bounded by _BATCH_CONCURRENCY.
+
+    A failed lookup is reported under 'errors' instead of failing the batch.
+    Repeated IDs are fetched once and reported once, in first-seen order.
+    """
+    ids = list(dict.fromkeys(ids))
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def fetch_one(item_id: int) -> dict:
+        async with semaphore:
+            return await fetch(item_id)
+
+    results = await asyncio.gather(
+        *(fetch_one(item_id) for item_id in ids),
+        return_exceptions=True,
+    )
+
+    items = []
+    errors = {}
+    for item_id, result in zip(ids, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            errors[item_id] = str(result)
+        else:
+            items.append(result)
+
+    return {"items": items, "errors": errors}
+
+
+@mcp.tool()
+async def get_service_orders_batch(
+    so_ids: Annotated[list[int], Field(description="Service order IDs to retrieve")],
+) -> dict:
+    """
+    Fetch several service orders by ID in one call.
+
+    Lookups run concurrently, so prefer this over repeated get_service_order
+    calls. Returns dict with 'items' (service orders found) and 'errors'
+    (error message keyed by service order ID).
+    """
+    return await _fetch_batch(get_service_order, so_ids)
+
+
+@mcp.tool()
+async def get_assets_batch(
+    asset_ids: Annotated[list[int], Field(description="Asset IDs to retrieve")],
+) -> dict:
+    """
+    Fetch several assets by ID in one call.
+
+    Lookups run concurrently, so prefer this over repeated get_asset calls.
+    Returns dict with 'items' (assets found) and 'errors' (error message
+    keyed by asset ID).
+    """
+    return await _fetch_batch(get_asset, asset_ids)
+
+
+@mcp.tool()
+async def list_service_order_documents_batch(
+    so_ids: Annotated[
+        list[int],
+        Field(description="Service order IDs to list documents for"),
+    ],
+) -> dict:
+    """
+    List documents for several service orders in one call.
+
+    Lookups run concurrently. Returns dict with 'items' (one entry per
+    service order, as returned by list_service_order_documents) and
+    'errors' (error message keyed by service order ID).
+    """
+    return await _fetch_batch(list_service_order_documents, so_ids)
 
 
 # ============================================================================
@@ -303,27 +780,34 @@ def list_service_order_documents(
 
 
 @mcp.resource("qualer://service-order/{so_id}")
-def service_order_resource(so_id: int) -> str:
+async def service_order_resource(so_id: int) -> str:
     """
-    Read-only view of a service order as formatted JSON.
+    Read-only view of a service order as JSON.
 
     Use this resource when you need to load service order context
     without making a direct API call. Ideal for agent reasoning tasks.
+    To load several service orders, prefer the get_service_orders_batch
+    tool over reading this resource once per ID. If Qualer is unreachable,
+    a recently fetched copy may be served with 'Cache-Warning' set to
+    'stale'.
     """
-    so = get_service_order(so_id)
-    return json.dumps(so, indent=2)
+    body, stale = await _get_service_order_raw(so_id)
+    return _resource_text(body, stale)
 
 
 @mcp.resource("qualer://asset/{asset_id}")
-def asset_resource(asset_id: int) -> str:
+async def asset_resource(asset_id: int) -> str:
     """
-    Read-only view of an asset as formatted JSON.
+    Read-only view of an asset as JSON.
 
     Use this resource when you need to load asset/equipment context
     without making a direct API call. Ideal for agent reasoning tasks.
+    To load several assets, prefer the get_assets_batch tool. If Qualer is
+    unreachable, a recently fetched copy may be served with 'Cache-Warning'
+    set to 'stale'.
     """
-    asset = get_asset(asset_id)
-    return json.dumps(asset, indent=2)
+    body, stale = await _get_asset_raw(asset_id)
+    return _resource_text(body, stale)
 
 
 # ============================================================================
@@ -333,12 +817,12 @@ def asset_resource(asset_id: int) -> str:
 
 def main():
     """Launch MCP server over stdio transport."""
-    global _client
-
-    # Initialize SDK client
-    _client = init_client()
+    # Initialize SDK client up front so a missing token fails at startup
+    get_client()
 
-    # Run the MCP server
+    # Run the MCP server, on uvloop's faster event loop where available
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     mcp.run()
 
 
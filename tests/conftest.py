@@ -0,0 +1,35 @@
+"""Shared pytest fixtures."""
+
+import httpx
+import pytest
+from qualer_sdk import AuthenticatedClient
+
+import qualer_mcp_server
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """Start and finish every test with empty response caches."""
+    qualer_mcp_server.clear_caches()
+    yield
+    qualer_mcp_server.clear_caches()
+
+
+@pytest.fixture
+def mock_qualer(monkeypatch):
+    """
+    Point the shared Qualer client at an httpx MockTransport.
+
+    Returns a function taking the transport's request handler.
+    """
+
+    def install(handler):
+        client = AuthenticatedClient(
+            base_url="https://qualer.test",
+            token="test-token",
+            raise_on_unexpected_status=True,
+            httpx_args={"transport": httpx.MockTransport(handler)},
+        )
+        monkeypatch.setattr(qualer_mcp_server, "_client", client)
+
+    return install
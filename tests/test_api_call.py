@@ -23,14 +23,14 @@ def test_init_client(qualer_client):
     assert qualer_client is not None
 
 
-def test_get_service_order_valid(qualer_client):
+async def test_get_service_order_valid(qualer_client):
     """Test fetching a valid service order.
 
     Note: This test uses a known service order ID.
     Update 1175961 if this ID is no longer valid in your test environment.
     """
     try:
-        result = get_service_order(1175961)
+        result = await get_service_order(1175961)
 
         # Verify it's a dict with expected fields
         assert isinstance(result, dict)
@@ -43,10 +43,10 @@ def test_get_service_order_valid(qualer_client):
         pytest.skip(f"Service order not available in test environment: {e}")
 
 
-def test_service_order_response_format(qualer_client):
+async def test_service_order_response_format(qualer_client):
     """Test that service order response has expected structure."""
     try:
-        result = get_service_order(1175961)
+        result = await get_service_order(1175961)
 
         # Check important fields
         required_fields = [
@@ -0,0 +1,215 @@
+"""
+Tests for the in-process Qualer response cache.
+
+Run with: pytest tests/test_cache.py -v
+"""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+from cachetools import TTLCache
+from qualer_sdk.errors import UnexpectedStatus
+
+import qualer_mcp_server
+
+
+async def test_cached_fetches_once():
+    """Test that a cache hit skips the fetch."""
+    cache = TTLCache(maxsize=8, ttl=60)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return {"id": 1}
+
+    first = await qualer_mcp_server._cached(cache, ("so", 1), fetch)
+    second = await qualer_mcp_server._cached(cache, ("so", 1), fetch)
+
+    assert first == second == {"id": 1}
+    assert len(calls) == 1
+
+
+async def test_cached_does_not_store_errors():
+    """Test that a failed fetch is not cached."""
+    cache = TTLCache(maxsize=8, ttl=60)
+
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await qualer_mcp_server._cached(cache, ("so", 1), fail)
+
+    assert ("so", 1) not in cache
+
+
+async def test_cached_remembers_not_found():
+    """Test that a 404 is cached briefly and re-raised without refetching."""
+    cache = TTLCache(maxsize=8, ttl=60)
+    calls = []
+
+    async def missing():
+        calls.append(1)
+        raise qualer_mcp_server.NotFoundError("Asset 9 not found")
+
+    for _ in range(2):
+        with pytest.raises(qualer_mcp_server.NotFoundError, match="Asset 9 not found"):
+            await qualer_mcp_server._cached(cache, ("asset", 9), missing)
+
+    assert len(calls) == 1
+
+
+def test_clear_caches():
+    """Test that clear_caches empties every response cache."""
+    qualer_mcp_server._so_cache[("so", 1)] = {"id": 1}
+    qualer_mcp_server._asset_cache[("asset", 2)] = {"id": 2}
+    qualer_mcp_server._documents_cache[("documents", 3)] = {"id": 3}
+    qualer_mcp_server._not_found_cache[("so", 4)] = "Service order 4 not found"
+    qualer_mcp_server._stale_cache[("so", 5)] = b"{}"
+    qualer_mcp_server._cursor_cache["token"] = ([], 0)
+
+    qualer_mcp_server.clear_caches()
+
+    assert len(qualer_mcp_server._so_cache) == 0
+    assert len(qualer_mcp_server._asset_cache) == 0
+    assert len(qualer_mcp_server._documents_cache) == 0
+    assert len(qualer_mcp_server._not_found_cache) == 0
+    assert len(qualer_mcp_server._stale_cache) == 0
+    assert len(qualer_mcp_server._cursor_cache) == 0
+
+
+async def test_cached_coalesces_concurrent_misses():
+    """Test that concurrent misses for one key share a single fetch."""
+    cache = TTLCache(maxsize=8, ttl=60)
+    calls = []
+    release = asyncio.Event()
+
+    async def fetch():
+        calls.append(1)
+        await release.wait()
+        return {"id": 1}
+
+    waiters = [
+        asyncio.ensure_future(qualer_mcp_server._cached(cache, ("so", 1), fetch)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert results == [{"id": 1}] * 3
+    assert len(calls) == 1
+    assert not qualer_mcp_server._inflight
+
+
+async def test_get_service_order_serves_stale_when_qualer_is_down(monkeypatch):
+    """Test that an outage falls back to the last good copy, flagged stale."""
+
+    async def fetch_ok(so_id):
+        return b'{"ServiceOrderId": 1}'
+
+    async def fetch_down(so_id):
+        raise ValueError("Error fetching service order 1") from httpx.ConnectError("down")
+
+    monkeypatch.setattr(qualer_mcp_server, "_fetch_service_order", fetch_ok)
+    fresh = await qualer_mcp_server.get_service_order(1)
+
+    # Let the fresh entry expire, then take Qualer down
+    qualer_mcp_server._so_cache.clear()
+    monkeypatch.setattr(qualer_mcp_server, "_fetch_service_order", fetch_down)
+    stale = await qualer_mcp_server.get_service_order(1)
+
+    assert fresh == {"ServiceOrderId": 1}
+    assert stale == {"ServiceOrderId": 1, "Cache-Warning": "stale"}
+
+
+async def test_stale_fallback_ignores_non_outage_errors():
+    """Test that client errors are raised even when a stale copy exists."""
+    qualer_mcp_server._stale_cache[("asset", 2)] = b'{"AssetId": 2}'
+    request = httpx.Request("GET", "https://example.invalid")
+    forbidden = httpx.HTTPStatusError(
+        "forbidden", request=request, response=httpx.Response(403, request=request)
+    )
+
+    async def fail():
+        raise ValueError("Error fetching asset 2") from forbidden
+
+    with pytest.raises(ValueError, match="asset 2"):
+        await qualer_mcp_server._with_stale_fallback(("asset", 2), fail())
+
+
+async def test_non_json_record_is_not_cached(mock_qualer):
+    """Test that a 200 response that is not JSON is reported and never cached."""
+    requests = []
+
+    def login_page(request):
+        requests.append(request)
+        return httpx.Response(200, content=b"<html>login</html>")
+
+    mock_qualer(login_page)
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Error fetching service order 7"):
+            await qualer_mcp_server.get_service_order(7)
+    with pytest.raises(ValueError, match="Error fetching service order 7"):
+        await qualer_mcp_server.service_order_resource(7)
+
+    assert len(requests) == 3
+    assert ("so", 7) not in qualer_mcp_server._so_cache
+    assert ("so", 7) not in qualer_mcp_server._stale_cache
+
+
+async def test_asset_serves_stale_on_server_error(mock_qualer):
+    """Test that a 5xx falls back to the last good asset, in tools and resources."""
+    statuses = [200, 503, 503]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), content=b'{"AssetId": 2}')
+
+    mock_qualer(handler)
+    fresh = await qualer_mcp_server.get_asset(2)
+
+    # Let the fresh entry expire, then have Qualer fail
+    qualer_mcp_server._asset_cache.clear()
+    stale = await qualer_mcp_server.get_asset(2)
+    resource = await qualer_mcp_server.asset_resource(2)
+
+    assert fresh == {"AssetId": 2}
+    assert stale == {"AssetId": 2, "Cache-Warning": "stale"}
+    assert orjson.loads(resource) == {"AssetId": 2, "Cache-Warning": "stale"}
+
+
+async def test_stale_fallback_on_sdk_server_error():
+    """Test that the SDK's UnexpectedStatus counts as an outage when 5xx."""
+    qualer_mcp_server._stale_cache[("so", 3)] = b'{"ServiceOrderId": 3}'
+
+    async def fail():
+        raise ValueError("Error fetching service order 3") from UnexpectedStatus(502, b"")
+
+    value, stale = await qualer_mcp_server._with_stale_fallback(("so", 3), fail())
+
+    assert value == b'{"ServiceOrderId": 3}'
+    assert stale is True
+
+
+async def test_limited_documents_fall_back_to_stale_listing(mock_qualer):
+    """Test that a limited listing falls back to the full stale listing on a 5xx."""
+    docs = [{"DocumentId": i} for i in range(4)]
+    statuses = [200, 500]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), content=orjson.dumps(docs))
+
+    mock_qualer(handler)
+    await qualer_mcp_server.list_service_order_documents(7)
+
+    # Expire the fresh listing so the limited call goes to Qualer
+    qualer_mcp_server._documents_cache.clear()
+    result = await qualer_mcp_server.list_service_order_documents(7, limit=2)
+
+    assert result == {
+        "service_order_id": 7,
+        "documents": docs[:2],
+        "truncated": True,
+        "Cache-Warning": "stale",
+    }
@@ -4,6 +4,10 @@ Tests to verify Qualer MCP server loads correctly.
 Run with: pytest tests/test_server.py -v
 """
 
+import dataclasses
+
+import httpx
+
 import qualer_mcp_server
 
 
@@ -44,7 +48,63 @@ def test_tool_functions_exist():
         "get_asset",
         "search_assets",
         "list_service_order_documents",
+        "get_service_orders_batch",
+        "get_assets_batch",
+        "list_service_order_documents_batch",
     ]
     for tool_name in tools:
         assert hasattr(qualer_mcp_server, tool_name)
         assert callable(getattr(qualer_mcp_server, tool_name))
+
+
+def test_public_api_exported():
+    """Test that __all__ only lists names the module defines."""
+    for name in qualer_mcp_server.__all__:
+        assert hasattr(qualer_mcp_server, name), name
+
+
+async def test_tool_schemas_keep_field_constraints():
+    """Test that Annotated Field metadata reaches the registered tool schemas."""
+    tools = {tool.name: tool for tool in await qualer_mcp_server.mcp.list_tools()}
+
+    limit = tools["search_assets"].inputSchema["properties"]["limit"]
+    assert limit["minimum"] == 1
+    assert limit["maximum"] == 100
+    assert limit["default"] == 25
+
+    so_id = tools["get_service_order"].inputSchema["properties"]["so_id"]
+    assert so_id["description"] == "Service order ID to retrieve"
+
+
+async def test_lifespan_drops_closed_client(mock_qualer):
+    """Test that ending a session closes the client and clears it for the next one."""
+    mock_qualer(lambda request: httpx.Response(200, content=b"{}"))
+    client = qualer_mcp_server._client
+
+    async with qualer_mcp_server._lifespan(qualer_mcp_server.mcp):
+        async with qualer_mcp_server._lifespan(qualer_mcp_server.mcp):
+            pass
+        # Another session is still open, so the pool stays up
+        assert qualer_mcp_server._client is client
+        assert not client.get_async_httpx_client().is_closed
+
+    assert client.get_async_httpx_client().is_closed
+    assert qualer_mcp_server._client is None
+
+
+async def test_init_client_keeps_sync_client_usable(monkeypatch):
+    """Test that the async client carries the SDK's auth and leaves the sync client alone."""
+    config = dataclasses.replace(qualer_mcp_server._CONFIG, token="test-token")
+    monkeypatch.setattr(qualer_mcp_server, "_CONFIG", config)
+
+    client = qualer_mcp_server.init_client()
+    async_client = client.get_async_httpx_client()
+    sync_client = client.get_httpx_client()
+
+    header = client.auth_header_name
+    assert async_client.headers[header] == sync_client.headers[header]
+    assert async_client.headers["Accept"] == "application/json"
+    assert not isinstance(sync_client._transport, httpx.AsyncBaseTransport)
+
+    sync_client.close()
+    await async_client.aclose()
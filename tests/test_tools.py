@@ -0,0 +1,164 @@
+"""
+Tests for MCP tool behaviour: search paging and batch lookups.
+
+Run with: pytest tests/test_tools.py -v
+"""
+
+import httpx
+import orjson
+import pytest
+
+import qualer_mcp_server
+
+
+async def test_search_service_orders_cursor_pages(monkeypatch):
+    """Test that cursor paging fetches the full result set only once."""
+    calls = []
+
+    async def fake_fetch(status):
+        calls.append(status)
+        return [{"ServiceOrderId": i} for i in range(5)]
+
+    monkeypatch.setattr(qualer_mcp_server, "_fetch_service_orders", fake_fetch)
+
+    search = qualer_mcp_server.search_service_orders
+    first = await search(status="Open", limit=2)
+    second = await search(limit=2, cursor=first["next_cursor"])
+    last = await search(limit=2, cursor=second["next_cursor"])
+
+    assert [o["ServiceOrderId"] for o in first["items"]] == [0, 1]
+    assert [o["ServiceOrderId"] for o in second["items"]] == [2, 3]
+    assert [o["ServiceOrderId"] for o in last["items"]] == [4]
+    assert last["next_cursor"] is None
+    assert first["total"] == 5
+    assert first["truncated"] is False
+    assert calls == ["Open"]
+
+
+async def test_search_service_orders_bounds_the_request(mock_qualer):
+    """Test that a new search asks Qualer for a bounded window of rows."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        window = qualer_mcp_server._SEARCH_WINDOW
+        return httpx.Response(
+            200, content=orjson.dumps([{"ServiceOrderId": i} for i in range(window)])
+        )
+
+    mock_qualer(handler)
+
+    result = await qualer_mcp_server.search_service_orders(status="Open", limit=10)
+
+    assert requests[0].url.params["limit"] == str(qualer_mcp_server._SEARCH_WINDOW)
+    assert len(result["items"]) == 10
+    assert result["truncated"] is True
+
+
+async def test_search_service_orders_rejects_unknown_cursor():
+    """Test that an expired or unknown cursor raises ValueError."""
+    with pytest.raises(ValueError):
+        await qualer_mcp_server.search_service_orders(cursor="not-a-cursor")
+
+
+async def test_search_tools_report_malformed_body(mock_qualer):
+    """Test that non-JSON search responses are reported as search errors."""
+    mock_qualer(lambda request: httpx.Response(200, content=b"<html>login</html>"))
+
+    with pytest.raises(ValueError, match="Error searching service orders"):
+        await qualer_mcp_server.search_service_orders(status="Open")
+
+    with pytest.raises(ValueError, match="Error searching assets"):
+        await qualer_mcp_server.search_assets(query="gauge")
+
+
+async def test_search_assets_reports_truncation(mock_qualer):
+    """Test that a server-side listing flags when more assets match than the limit."""
+    rows = []
+    mock_qualer(lambda request: httpx.Response(200, content=orjson.dumps(rows)))
+
+    rows[:] = [{"AssetId": i} for i in range(4)]
+    capped = await qualer_mcp_server.search_assets(limit=3)
+
+    rows[:] = [{"AssetId": i} for i in range(2)]
+    complete = await qualer_mcp_server.search_assets(limit=3)
+
+    assert capped["items"] == [{"AssetId": 0}, {"AssetId": 1}, {"AssetId": 2}]
+    assert capped["truncated"] is True
+    assert complete["total"] == 2
+    assert complete["truncated"] is False
+
+
+async def test_fetch_batch_dedupes_and_collects_errors():
+    """Test that batch lookups fetch each ID once and report failures per ID."""
+    calls = []
+
+    async def fetch(item_id):
+        calls.append(item_id)
+        if item_id == 2:
+            raise ValueError("Service order 2 not found")
+        return {"ServiceOrderId": item_id}
+
+    result = await qualer_mcp_server._fetch_batch(fetch, [1, 2, 1, 3])
+
+    assert sorted(calls) == [1, 2, 3]
+    assert result["items"] == [{"ServiceOrderId": 1}, {"ServiceOrderId": 3}]
+    assert result["errors"] == {2: "Service order 2 not found"}
+
+
+async def test_list_documents_stops_reading_past_limit(mock_qualer):
+    """Test that a limited listing stops streaming once it has limit + 1 documents."""
+    requests = []
+    sent = []
+
+    async def body():
+        for i in range(6):
+            sent.append(i)
+            yield (b"[" if i == 0 else b",") + orjson.dumps({"DocumentId": i})
+        yield b"]"
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=body())
+
+    mock_qualer(handler)
+
+    result = await qualer_mcp_server.list_service_order_documents(7, limit=2)
+
+    assert result["documents"] == [{"DocumentId": 0}, {"DocumentId": 1}]
+    assert result["truncated"] is True
+    assert len(sent) < 6
+
+    # The cut-short listing is never cached, so a full call refetches it
+    full = await qualer_mcp_server.list_service_order_documents(7)
+
+    assert len(requests) == 2
+    assert len(full["documents"]) == 6
+    assert full["truncated"] is False
+
+
+async def test_list_documents_reads_full_listing(mock_qualer):
+    """Test that an unlimited listing parses every streamed document."""
+    docs = [{"DocumentId": i, "FileName": f"cert-{i}.pdf"} for i in range(4)]
+    mock_qualer(lambda request: httpx.Response(200, content=orjson.dumps(docs)))
+
+    result = await qualer_mcp_server.list_service_order_documents(7)
+
+    assert result == {"service_order_id": 7, "documents": docs, "truncated": False}
+
+
+async def test_list_documents_missing_service_order(mock_qualer):
+    """Test that a 404 listing raises NotFoundError."""
+    mock_qualer(lambda request: httpx.Response(404))
+
+    with pytest.raises(qualer_mcp_server.NotFoundError, match="Service order 7 not found"):
+        await qualer_mcp_server.list_service_order_documents(7)
+
+
+async def test_list_documents_malformed_body(mock_qualer):
+    """Test that a non-JSON listing is reported as a fetch error."""
+    mock_qualer(lambda request: httpx.Response(200, content=b"<html>login</html>"))
+
+    with pytest.raises(ValueError, match="Error fetching documents for SO 7"):
+        await qualer_mcp_server.list_service_order_documents(7)
+    assert ("documents", 7) not in qualer_mcp_server._documents_cache